@@ -0,0 +1,20 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.analytics.utils import rollup_system_metrics, rollup_system_metrics_hourly
+
+class Command(BaseCommand):
+    help = 'Roll raw SystemMetrics up into per-minute and per-hour rows (schedule every minute via cron)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--minutes', type=int, default=5,
+                            help='How many recent minutes to (re)aggregate')
+    
+    def handle(self, *args, **options):
+        since = timezone.now() - timedelta(minutes=options['minutes'])
+        count = rollup_system_metrics(since)
+        self.stdout.write(f"Rolled up {count} minute buckets")
+        
+        # Hours touched by the window are recomputed from their first sample
+        count = rollup_system_metrics_hourly(since)
+        self.stdout.write(f"Rolled up {count} hour buckets")
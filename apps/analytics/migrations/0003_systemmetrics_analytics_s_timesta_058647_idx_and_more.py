@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='systemmetrics',
+            index=models.Index(fields=['-timestamp'], name='analytics_s_timesta_058647_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='useractivity',
+            index=models.Index(fields=['-timestamp'], name='analytics_u_timesta_d8c879_idx'),
+        ),
+    ]
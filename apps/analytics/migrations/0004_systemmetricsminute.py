@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:47
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_systemmetrics_analytics_s_timesta_058647_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SystemMetricsMinute',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('minute', models.DateTimeField(unique=True)),
+                ('samples', models.IntegerField(default=0)),
+                ('avg_cpu', models.FloatField(null=True)),
+                ('avg_memory', models.FloatField(null=True)),
+                ('avg_response_time', models.FloatField(null=True)),
+                ('max_cpu', models.FloatField(null=True)),
+                ('max_memory', models.FloatField(null=True)),
+                ('max_response_time', models.IntegerField(null=True)),
+            ],
+        ),
+    ]
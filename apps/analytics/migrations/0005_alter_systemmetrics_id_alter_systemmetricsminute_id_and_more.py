@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:48
+
+import apps.core.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0004_systemmetricsminute'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='systemmetrics',
+            name='id',
+            field=models.UUIDField(default=apps.core.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='systemmetricsminute',
+            name='id',
+            field=models.UUIDField(default=apps.core.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='useractivity',
+            name='id',
+            field=models.UUIDField(default=apps.core.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:51
+
+from django.db import migrations
+
+
+def create_brin_indexes(apps, schema_editor):
+    # BRIN is PostgreSQL-only; the B-tree indexes still serve ORDER BY ... LIMIT
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS sm_ts_brin ON analytics_systemmetrics '
+            'USING BRIN (timestamp) WITH (pages_per_range = 32)'
+        )
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS ua_ts_brin ON analytics_useractivity USING BRIN (timestamp)'
+        )
+
+
+def drop_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS sm_ts_brin')
+        schema_editor.execute('DROP INDEX IF EXISTS ua_ts_brin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0005_alter_systemmetrics_id_alter_systemmetricsminute_id_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_indexes, drop_brin_indexes),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:58
+
+import apps.core.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0006_timestamp_brin_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SystemMetricsHourly',
+            fields=[
+                ('id', models.UUIDField(default=apps.core.utils.uuid7, editable=False, primary_key=True, serialize=False)),
+                ('hour', models.DateTimeField(unique=True)),
+                ('samples', models.IntegerField(default=0)),
+                ('avg_cpu', models.FloatField(null=True)),
+                ('avg_memory', models.FloatField(null=True)),
+                ('avg_response', models.FloatField(null=True)),
+            ],
+        ),
+    ]
@@ -1,18 +1,46 @@
 from django.db import models
 from django.conf import settings
-import uuid
+from apps.core.utils import uuid7
 
 class UserActivity(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     event_type = models.CharField(max_length=50)
     timestamp = models.DateTimeField(auto_now_add=True)
     ip_address = models.GenericIPAddressField()
     details = models.JSONField(default=dict)
 
+    class Meta:
+        indexes = [models.Index(fields=['-timestamp'])]
+
 class SystemMetrics(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     timestamp = models.DateTimeField()
     cpu_usage = models.FloatField(null=True)
     memory_usage = models.FloatField(null=True)
     response_time = models.IntegerField(null=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['-timestamp'])]
+
+
+class SystemMetricsMinute(models.Model):
+    """Per-minute rollup of SystemMetrics, filled by the rollup_metrics command"""
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    minute = models.DateTimeField(unique=True)
+    samples = models.IntegerField(default=0)
+    avg_cpu = models.FloatField(null=True)
+    avg_memory = models.FloatField(null=True)
+    avg_response_time = models.FloatField(null=True)
+    max_cpu = models.FloatField(null=True)
+    max_memory = models.FloatField(null=True)
+    max_response_time = models.IntegerField(null=True)
+
+class SystemMetricsHourly(models.Model):
+    """Per-hour rollup of SystemMetrics for trend charts, filled by the rollup_metrics command"""
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    hour = models.DateTimeField(unique=True)
+    samples = models.IntegerField(default=0)
+    avg_cpu = models.FloatField(null=True)
+    avg_memory = models.FloatField(null=True)
+    avg_response = models.FloatField(null=True)
\ No newline at end of file
@@ -4,9 +4,19 @@ from .models import SystemMetrics, UserActivity
 class SystemMetricsSerializer(serializers.ModelSerializer):
     class Meta:
         model = SystemMetrics
-        fields = '__all__'
+        fields = ('id', 'timestamp', 'cpu_usage', 'memory_usage', 'response_time')
 
 class UserActivitySerializer(serializers.ModelSerializer):
+    """Lean representation for list views"""
+    user_username = serializers.CharField(source='user.username', read_only=True)
+    
     class Meta:
         model = UserActivity
-        fields = '__all__'
+        fields = ('id', 'timestamp', 'user', 'user_username', 'event_type', 'ip_address')
+
+class UserActivityDetailSerializer(serializers.ModelSerializer):
+    user_username = serializers.CharField(source='user.username', read_only=True)
+    
+    class Meta:
+        model = UserActivity
+        fields = ('id', 'timestamp', 'user', 'user_username', 'event_type', 'ip_address', 'details')
@@ -1,3 +1,80 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from .models import SystemMetrics
+from .utils import rollup_system_metrics, rollup_system_metrics_hourly
+from .views import SystemMetricsViewSet
+
+
+class PerformanceOverviewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username='analyst', password='pass')
+
+    def get_overview(self):
+        request = APIRequestFactory().get('/api/analytics/metrics/performance_overview/')
+        force_authenticate(request, user=self.user)
+        return SystemMetricsViewSet.as_view({'get': 'performance_overview'})(request).data
+
+    def test_overview_adds_samples_newer_than_rollup(self):
+        now = timezone.now()
+        for minutes, cpu in ((10, 20.0), (5, 40.0)):
+            SystemMetrics.objects.create(
+                timestamp=now - timedelta(minutes=minutes), cpu_usage=cpu, memory_usage=40.0, response_time=100
+            )
+        rollup_system_metrics()
+        SystemMetrics.objects.create(
+            timestamp=now, cpu_usage=60.0, memory_usage=80.0, response_time=300
+        )
+        overview = self.get_overview()
+        self.assertEqual(overview['avg_cpu'], 40.0)
+        self.assertEqual(overview['max_memory'], 80.0)
+        self.assertEqual(overview['max_response_time'], 300)
+        self.assertEqual(overview['data_points'], 3)
+        self.assertEqual(overview['performance_status'], 'good')
+
+    def test_overview_reads_raw_samples_of_minutes_without_rollup(self):
+        now = timezone.now()
+        for minutes, cpu in ((180, 10.0), (120, 20.0), (10, 30.0), (5, 40.0), (0, 50.0)):
+            SystemMetrics.objects.create(
+                timestamp=now - timedelta(minutes=minutes), cpu_usage=cpu, memory_usage=40.0, response_time=100
+            )
+        # Like rollup_metrics' default --minutes=5 window: older samples are never rolled up
+        rollup_system_metrics(now - timedelta(minutes=15))
+        overview = self.get_overview()
+        self.assertEqual(overview['data_points'], 5)
+        self.assertEqual(overview['avg_cpu'], 30.0)
+        self.assertEqual(overview['max_cpu'], 50.0)
+
+    def test_overview_empty_window_is_zero(self):
+        overview = self.get_overview()
+        self.assertEqual(overview['avg_cpu'], 0.0)
+        self.assertEqual(overview['max_cpu'], 0)
+        self.assertEqual(overview['data_points'], 0)
+        self.assertEqual(overview['performance_status'], 'good')
+
+
+class PerformanceTrendsTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='analyst', password='pass')
+
+    def get_trends(self):
+        request = APIRequestFactory().get('/api/analytics/metrics/performance_trends/')
+        force_authenticate(request, user=self.user)
+        return SystemMetricsViewSet.as_view({'get': 'performance_trends'})(request).data['hourly_trends']
 
-# Create your tests here.
+    def test_trends_include_hours_without_rollup(self):
+        now = timezone.now()
+        for hours, cpu in ((3, 10.0), (2, 20.0), (1, 30.0)):
+            SystemMetrics.objects.create(
+                timestamp=now - timedelta(hours=hours), cpu_usage=cpu, memory_usage=40.0, response_time=100
+            )
+        # Only the two most recent hours get a rollup row
+        rollup_system_metrics_hourly(now - timedelta(hours=2))
+        trends = self.get_trends()
+        self.assertEqual([hour['avg_cpu'] for hour in trends], [10.0, 20.0, 30.0])
@@ -0,0 +1,75 @@
+from datetime import timedelta
+from django.db.models import Avg, Count, Max
+from django.db.models.functions import TruncHour, TruncMinute
+from django.utils import timezone
+from apps.core.utils import bulk_insert_events
+from .models import SystemMetrics, SystemMetricsHourly, SystemMetricsMinute, UserActivity
+
+def log_activities_bulk(rows, batch_size=500):
+    """Record many UserActivity rows with batched INSERTs instead of one save() each"""
+    return bulk_insert_events(UserActivity, rows, batch_size)
+
+def rollup_system_metrics(since=None):
+    """Upsert per-minute aggregates of raw SystemMetrics into SystemMetricsMinute"""
+    if since is None:
+        since = timezone.now() - timedelta(hours=24)
+    since = since.replace(second=0, microsecond=0)
+    
+    buckets = SystemMetrics.objects.filter(
+        timestamp__gte=since
+    ).annotate(
+        minute=TruncMinute('timestamp')
+    ).values('minute').annotate(
+        samples=Count('id'),
+        avg_cpu=Avg('cpu_usage'),
+        avg_memory=Avg('memory_usage'),
+        avg_response_time=Avg('response_time'),
+        max_cpu=Max('cpu_usage'),
+        max_memory=Max('memory_usage'),
+        max_response_time=Max('response_time')
+    ).order_by('minute')
+    
+    rows = [SystemMetricsMinute(**bucket) for bucket in buckets]
+    
+    # Re-running over the same window refreshes existing minutes in place
+    SystemMetricsMinute.objects.bulk_create(
+        rows,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=['minute'],
+        update_fields=[
+            'samples', 'avg_cpu', 'avg_memory', 'avg_response_time',
+            'max_cpu', 'max_memory', 'max_response_time'
+        ]
+    )
+    
+    return len(rows)
+
+def rollup_system_metrics_hourly(since=None):
+    """Upsert per-hour averages of raw SystemMetrics into SystemMetricsHourly"""
+    if since is None:
+        since = timezone.now() - timedelta(hours=24)
+    since = timezone.localtime(since).replace(minute=0, second=0, microsecond=0)
+    
+    buckets = SystemMetrics.objects.filter(
+        timestamp__gte=since
+    ).annotate(
+        hour=TruncHour('timestamp')
+    ).values('hour').annotate(
+        samples=Count('id'),
+        avg_cpu=Avg('cpu_usage'),
+        avg_memory=Avg('memory_usage'),
+        avg_response=Avg('response_time')
+    ).order_by('hour')
+    
+    rows = [SystemMetricsHourly(**bucket) for bucket in buckets]
+    
+    SystemMetricsHourly.objects.bulk_create(
+        rows,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=['hour'],
+        update_fields=['samples', 'avg_cpu', 'avg_memory', 'avg_response']
+    )
+    
+    return len(rows)
@@ -1,59 +1,207 @@
-from rest_framework import viewsets, permissions
+from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Avg, Max, Min
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from django.db.models import Avg, Count, Exists, F, Max, Min, OuterRef, Q, Sum
+from django.db.models.functions import Now, TruncHour, TruncMinute
 from django.utils import timezone
 from datetime import timedelta
-from .models import SystemMetrics, UserActivity
+from operator import itemgetter
+from apps.core.mixins import DateFilterMixin
+from apps.core.renderers import dumps
+from .models import SystemMetrics, SystemMetricsHourly, SystemMetricsMinute, UserActivity
+from .serializers import SystemMetricsSerializer
 
-class SystemMetricsViewSet(viewsets.ModelViewSet):
+TIMELINE_FIELDS = ('timestamp', 'cpu_usage', 'memory_usage', 'response_time')
+
+# Hard cap on raw samples per timeline response (?limit= can only lower it)
+TIMELINE_MAX_POINTS = 10000
+
+# Overview metric name -> raw SystemMetrics column (rollups store avg_<name> / max_<name>)
+OVERVIEW_METRICS = {
+    'cpu': 'cpu_usage',
+    'memory': 'memory_usage',
+    'response_time': 'response_time',
+}
+
+# Supported ?bucket= values for downsampling the timeline
+TIMELINE_BUCKETS = {
+    '1m': TruncMinute,
+    '1h': TruncHour,
+}
+
+class SystemMetricsViewSet(DateFilterMixin, viewsets.ModelViewSet):
     queryset = SystemMetrics.objects.all()
+    serializer_class = SystemMetricsSerializer
     permission_classes = [permissions.IsAuthenticated]
+    default_window = timedelta(hours=24)
     
     @action(detail=False, methods=['get'])
     def performance_timeline(self, request):
         """Get performance metrics for timeline charts"""
-        # Get last 24 hours of data
+        # Get last 24 hours of data (cutoff computed by the database clock)
         metrics = SystemMetrics.objects.filter(
-            timestamp__gte=timezone.now() - timedelta(hours=24)
-        ).order_by('timestamp')
-        
-        data = []
-        for metric in metrics:
-            data.append({
-                'timestamp': metric.timestamp.isoformat(),
-                'cpu_usage': metric.cpu_usage,
-                'memory_usage': metric.memory_usage,
-                'response_time': metric.response_time
-            })
+            timestamp__gte=Now() - timedelta(hours=24)
+        )
+        
+        bucket = TIMELINE_BUCKETS.get(request.GET.get('bucket'))
+        if bucket:
+            # Average per bucket in the database instead of returning every sample
+            rows = metrics.annotate(
+                period=bucket('timestamp')
+            ).values('period').annotate(
+                avg_cpu=Avg('cpu_usage'),
+                avg_memory=Avg('memory_usage'),
+                avg_response=Avg('response_time')
+            ).order_by('period')
+            
+            data = [{
+                'timestamp': row['period'].isoformat(),
+                'cpu_usage': row['avg_cpu'],
+                'memory_usage': row['avg_memory'],
+                'response_time': row['avg_response']
+            } for row in rows]
+            
+            return Response(data)
+        
+        try:
+            limit = min(int(request.GET.get('limit', TIMELINE_MAX_POINTS)), TIMELINE_MAX_POINTS)
+        except ValueError:
+            return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Newest samples win when the window holds more than the cap
+        recent_ids = metrics.order_by('-timestamp').values('id')[:max(limit, 0)]
+        metrics = metrics.filter(id__in=recent_ids).order_by('timestamp')
+        
+        if request.GET.get('layout') == 'columns':
+            # One list per field instead of a dict per row; the renderer encodes the datetimes
+            columns = list(zip(*metrics.values_list(*TIMELINE_FIELDS))) or [()] * len(TIMELINE_FIELDS)
+            return Response({field: list(values) for field, values in zip(TIMELINE_FIELDS, columns)})
+        
+        # Fetch plain dicts instead of model instances
+        metrics = metrics.values(*TIMELINE_FIELDS)
+        
+        if request.GET.get('stream') == 'ndjson':
+            # One JSON document per line, written while rows are still being read
+            rows = metrics.iterator(chunk_size=500)
+            return StreamingHttpResponse(
+                (dumps(row) + b'\n' for row in rows),
+                content_type='application/x-ndjson'
+            )
+        
+        data = [
+            {**metric, 'timestamp': metric['timestamp'].isoformat()}
+            for metric in metrics.iterator(chunk_size=2000)
+        ]
         
         return Response(data)
     
     @action(detail=False, methods=['get'])
     def performance_overview(self, request):
         """Get system performance metrics overview"""
-        # Get recent metrics (last 24 hours)
-        recent_metrics = SystemMetrics.objects.filter(
-            timestamp__gte=timezone.now() - timedelta(hours=24)
+        return Response(cache.get_or_set('perf_overview', self._compute_performance_overview, 15))
+    
+    def _compute_performance_overview(self):
+        # Get recent metrics (last 24 hours), cutoff rounded to the minute
+        cutoff = timezone.now().replace(second=0, microsecond=0) - timedelta(hours=24)
+        
+        # Per-minute rollups (rollup_metrics command) stand in for the raw samples of the minutes
+        # they cover, except the newest one, which may have been rolled up while still filling
+        boundary = SystemMetricsMinute.objects.filter(
+            minute__gte=cutoff
+        ).aggregate(last=Max('minute'))['last'] or cutoff
+        rolled_up = SystemMetricsMinute.objects.filter(minute__gte=cutoff, minute__lt=boundary)
+        
+        rollup = rolled_up.aggregate(
+            **{f'{name}_sum': Sum(F(f'avg_{name}') * F('samples')) for name in OVERVIEW_METRICS},
+            **{
+                f'{name}_count': Sum('samples', filter=Q(**{f'avg_{name}__isnull': False}))
+                for name in OVERVIEW_METRICS
+            },
+            **{f'max_{name}': Max(f'max_{name}') for name in OVERVIEW_METRICS},
+            data_points=Sum('samples')
         )
         
-        if not recent_metrics.exists():
-            return Response({
-                'avg_cpu': 0,
-                'avg_memory': 0,
-                'avg_response_time': 0,
-                'max_cpu': 0,
-                'max_memory': 0,
-                'max_response_time': 0
-            })
+        # Raw samples of every minute without a usable rollup row: before the cron's first run,
+        # minutes it skipped, and the newest minute onwards (all of them when nothing is rolled up)
+        tail = SystemMetrics.objects.filter(timestamp__gte=cutoff).annotate(
+            minute=TruncMinute('timestamp')
+        ).exclude(
+            Exists(rolled_up.filter(minute=OuterRef('minute')))
+        ).aggregate(
+            **{f'{name}_sum': Sum(column) for name, column in OVERVIEW_METRICS.items()},
+            **{f'{name}_count': Count(column) for name, column in OVERVIEW_METRICS.items()},
+            **{f'max_{name}': Max(column) for name, column in OVERVIEW_METRICS.items()},
+            data_points=Count('id')
+        )
+        
+        # Empty windows come back as zeros instead of NULLs
+        stats = {}
+        for name in OVERVIEW_METRICS:
+            total = (rollup[f'{name}_sum'] or 0) + (tail[f'{name}_sum'] or 0)
+            count = (rollup[f'{name}_count'] or 0) + (tail[f'{name}_count'] or 0)
+            stats[f'avg_{name}'] = total / count if count else 0.0
+        for name in OVERVIEW_METRICS:
+            peaks = [value for value in (rollup[f'max_{name}'], tail[f'max_{name}']) if value is not None]
+            stats[f'max_{name}'] = max(peaks, default=0)
+        stats['data_points'] = (rollup['data_points'] or 0) + tail['data_points']
+        
+        # Calculate performance status
+        if stats['avg_cpu'] > 80 or stats['avg_memory'] > 85 or stats['avg_response_time'] > 500:
+            stats['performance_status'] = 'critical'
+        elif stats['avg_cpu'] > 60 or stats['avg_memory'] > 70 or stats['avg_response_time'] > 300:
+            stats['performance_status'] = 'warning'
+        else:
+            stats['performance_status'] = 'good'
+        
+        return stats
+    
+    @action(detail=False, methods=['get'])
+    def performance_trends(self, request):
+        """Get performance trends and predictions"""
+        date_filters = self.get_date_filter(request)
+        
+        # Completed hours come from the rollup table (rollup_metrics command) where it has a row
+        current_hour = timezone.localtime().replace(minute=0, second=0, microsecond=0)
+        hour_filters = {
+            lookup.replace('timestamp', 'hour'): (
+                timezone.localtime(value).replace(minute=0, second=0, microsecond=0)
+                if lookup == 'timestamp__gte' else value
+            )
+            for lookup, value in date_filters.items()
+        }
+        
+        rolled_up = SystemMetricsHourly.objects.filter(hour__lt=current_hour, **hour_filters)
+        hourly_metrics = list(rolled_up.values('hour', 'avg_cpu', 'avg_memory', 'avg_response'))
         
-        stats = recent_metrics.aggregate(
+        # Every other hour (the one in progress, and any the cron has not rolled up) is
+        # aggregated live from its raw samples
+        hourly_metrics += SystemMetrics.objects.filter(**date_filters).annotate(
+            hour=TruncHour('timestamp')
+        ).exclude(
+            Exists(rolled_up.filter(hour=OuterRef('hour')))
+        ).values('hour').annotate(
             avg_cpu=Avg('cpu_usage'),
             avg_memory=Avg('memory_usage'),
-            avg_response_time=Avg('response_time'),
-            max_cpu=Max('cpu_usage'),
-            max_memory=Max('memory_usage'),
-            max_response_time=Max('response_time')
-        )
+            avg_response=Avg('response_time')
+        ).order_by()
+        hourly_metrics.sort(key=itemgetter('hour'))
+        
+        trends = []
+        for metric in hourly_metrics:
+            trends.append({
+                'hour': metric['hour'].isoformat(),
+                'avg_cpu': round(metric['avg_cpu'] or 0, 2),
+                'avg_memory': round(metric['avg_memory'] or 0, 2),
+                'avg_response_time': round(metric['avg_response'] or 0, 2)
+            })
         
-        return Response(stats)
+        return Response({
+            'hourly_trends': trends,
+            'trend_analysis': {
+                'data_points': len(trends),
+                'time_span_hours': len(trends),
+                'analysis_generated_at': timezone.now().isoformat()
+            }
+        })
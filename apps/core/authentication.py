@@ -0,0 +1,64 @@
+import hashlib
+from django.core.cache import caches
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+# Seconds a worker reuses a token's user row before reading auth_user again
+USER_CACHE_TTL = 60
+
+# Columns loaded for request.user; covers everything the profile endpoint reads
+USER_FIELDS = (
+    'id', 'username', 'email', 'first_name', 'last_name', 'role',
+    'is_staff', 'is_superuser', 'is_active', 'date_joined', 'last_login'
+)
+
+def user_cache_key(user_id):
+    return f'auth:user:{user_id}'
+
+def profile_cache_key(user_id):
+    return f'auth:profile:{user_id}'
+
+def token_digest(validated_token):
+    """Short fixed-size fingerprint of the token's jti, stored next to the cached user"""
+    jti = str(validated_token.get(api_settings.JTI_CLAIM, ''))
+    return hashlib.blake2b(jti.encode(), digest_size=16).hexdigest()
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that keeps resolved users in the per-process cache
+
+    Entries live in each worker's own memory. Saving or deleting a user clears only the
+    current worker's copy (apps.core.signals), so another worker can keep serving a
+    deactivated or deleted user for up to USER_CACHE_TTL seconds on the same token;
+    a new token (fresh login) always reads the row again.
+    """
+
+    def get_user(self, validated_token):
+        # The token signature is checked on every request; only the user lookup is cached
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+
+        local_cache = caches['local']
+        key = user_cache_key(user_id)
+        digest = token_digest(validated_token)
+        cached = local_cache.get(key)
+        if cached is not None and cached[0] == digest:
+            user = cached[1]
+        else:
+            user = self.load_user(user_id, validated_token)
+            local_cache.set(key, (digest, user), USER_CACHE_TTL)
+
+        if getattr(api_settings, 'CHECK_USER_IS_ACTIVE', True) and not user.is_active:
+            raise AuthenticationFailed('User is inactive', code='user_inactive')
+        return user
+
+    def load_user(self, user_id, validated_token):
+        """Read the token's user, loading only USER_FIELDS"""
+        # Revocation compares the password hash (simplejwt >= 5.3); leave that to the full lookup
+        if getattr(api_settings, 'CHECK_REVOKE_TOKEN', False):
+            return super().get_user(validated_token)
+        try:
+            return self.user_model.objects.only(*USER_FIELDS).get(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed('User not found', code='user_not_found')
@@ -0,0 +1,93 @@
+import uuid
+from datetime import timedelta
+from django.db.models import Q
+from django.utils import timezone
+
+try:
+    from ciso8601 import parse_datetime as parse_iso_datetime
+except ImportError:  # Optional speedup, fall back to dateutil's ISO parser
+    from dateutil.parser import isoparse as parse_iso_datetime
+
+class ListDetailSerializerMixin:
+    """Use a lean serializer (and matching .only() columns) for list, the full one elsewhere"""
+    list_serializer_class = None
+    # Heavy columns only single-object views serialize; deferred everywhere else
+    detail_only_fields = ()
+    
+    def get_serializer_class(self):
+        if self.action == 'list' and self.list_serializer_class is not None:
+            return self.list_serializer_class
+        return super().get_serializer_class()
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list' and self.list_serializer_class is not None:
+            queryset = queryset.only(*self.get_list_columns())
+        elif self.detail_only_fields and not self.detail:
+            queryset = queryset.defer(*self.detail_only_fields)
+        return queryset
+    
+    def get_list_columns(self):
+        # Serializer sources map onto ORM paths, e.g. 'user.username' -> 'user__username'
+        serializer = self.list_serializer_class()
+        return [
+            field.source.replace('.', '__')
+            for field in serializer.fields.values()
+            if field.source != '*'
+        ]
+
+class DateFilterMixin:
+    """Turn ?start_date= / ?end_date= into timestamp lookups, defaulting to a recent window"""
+    default_window = timedelta(days=7)
+    timestamp_field = 'timestamp'
+    
+    def get_date_filter(self, request):
+        """Parse date filter parameters"""
+        start_date = request.GET.get('start_date')
+        end_date = request.GET.get('end_date')
+        
+        filters = {}
+        
+        start_dt = self.parse_date_param(start_date)
+        if start_dt:
+            filters[f'{self.timestamp_field}__gte'] = start_dt
+        
+        end_dt = self.parse_date_param(end_date)
+        if end_dt:
+            filters[f'{self.timestamp_field}__lte'] = end_dt
+        
+        # Default to the recent window if no dates provided
+        if not start_date and not end_date:
+            filters[f'{self.timestamp_field}__gte'] = timezone.now() - self.default_window
+        
+        return filters
+    
+    def parse_date_param(self, value):
+        # Malformed values are ignored, like a missing parameter
+        if not value:
+            return None
+        try:
+            parsed = parse_iso_datetime(value)
+        except (ValueError, TypeError, OverflowError):
+            return None
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+    
+    def keyset_filter(self, cursor):
+        """Rows after a "<timestamp>,<id>" cursor in (-timestamp, -id) order; None when malformed"""
+        timestamp, _, row_id = cursor.rpartition(',')
+        before = self.parse_date_param(timestamp)
+        try:
+            row_id = uuid.UUID(row_id)
+        except ValueError:
+            return None
+        if before is None:
+            return None
+        # The id tiebreak keeps rows that share the last page's timestamp
+        field = self.timestamp_field
+        return Q(**{f'{field}__lt': before}) | Q(**{field: before, 'id__lt': row_id})
+    
+    def make_cursor(self, row):
+        """Cursor for the page that continues after this row (dict with id and timestamp)"""
+        return f"{row[self.timestamp_field].isoformat()},{row['id']}"
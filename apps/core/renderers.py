@@ -0,0 +1,40 @@
+import json
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to DRF's encoder
+    orjson = None
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer backed by orjson (C extension) when it is installed"""
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        if data is None:
+            return b''
+        
+        # Types orjson can't handle natively (Decimal, lazy strings) go through DRF's encoder
+        return orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+class CSVRenderer(BaseRenderer):
+    """Lets ?format=csv through content negotiation; views stream the CSV body themselves"""
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return data
+
+def dumps(data):
+    """Encode a single document to JSON bytes, for hand-built (e.g. streaming) responses"""
+    if orjson is None:
+        return json.dumps(data, cls=JSONEncoder).encode()
+    return orjson.dumps(data, default=JSONEncoder().default, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
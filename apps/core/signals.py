@@ -0,0 +1,10 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .authentication import profile_cache_key, user_cache_key
+
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Drop this worker's cached user and profile after a save (password change, last_login, ...) or delete"""
+    caches['local'].delete_many([user_cache_key(instance.pk), profile_cache_key(instance.pk)])
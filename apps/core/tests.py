@@ -1,3 +1,95 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
 from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
 
-# Create your tests here.
+from apps.analytics.models import UserActivity
+from apps.security.models import SecurityEvent
+from .authentication import CachedJWTAuthentication
+from .views import UserActivityViewSet
+
+
+class AuditLogTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username='analyst', password='pass')
+        for event_type in ('login', 'export'):
+            UserActivity.objects.create(
+                user=self.user, event_type=event_type, ip_address='10.0.0.2', details={'ok': True}
+            )
+        SecurityEvent.objects.create(event_type='login_failure', severity='high', source_ip='10.0.0.1')
+
+    def get_audit_log(self):
+        request = APIRequestFactory().get('/api/activities/audit_log/')
+        force_authenticate(request, user=self.user)
+        return UserActivityViewSet.as_view({'get': 'audit_log'})(request).data
+
+    def test_audit_log_merges_activities_and_security_events(self):
+        with self.assertNumQueries(1):
+            data = self.get_audit_log()
+        self.assertEqual(data['total_user_activities'], 2)
+        self.assertEqual(data['total_security_events'], 1)
+        self.assertEqual(data['activities'][0]['severity'], 'high')
+        self.assertEqual({row['user'] for row in data['activities'][1:]}, {'analyst'})
+        self.assertEqual(data['activities'][1]['details'], {'ok': True})
+
+
+class RecentActivityCursorTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='analyst', password='pass')
+        events = SecurityEvent.objects.bulk_create(
+            SecurityEvent(event_type='scan', severity='low', source_ip='10.0.0.1') for _ in range(60)
+        )
+        # Every event shares one timestamp, so only the id keeps pages apart
+        SecurityEvent.objects.filter(id__in=[event.id for event in events]).update(
+            timestamp=events[0].timestamp
+        )
+
+    def get_page(self, **params):
+        request = APIRequestFactory().get('/api/activities/recent_activity/', params)
+        force_authenticate(request, user=self.user)
+        return UserActivityViewSet.as_view({'get': 'recent_activity'})(request)
+
+    def test_cursor_pages_through_equal_timestamps(self):
+        first = self.get_page()
+        second = self.get_page(before=first['X-Next-Cursor'])
+        self.assertEqual(len(first.data), 50)
+        self.assertEqual(len(second.data), 10)
+        ids = {row['id'] for row in first.data} | {row['id'] for row in second.data}
+        self.assertEqual(len(ids), 60)
+
+    def test_malformed_cursor_is_rejected(self):
+        self.assertEqual(self.get_page(before='yesterday').status_code, 400)
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        caches['local'].clear()
+        self.user = get_user_model().objects.create_user(username='analyst', password='pass')
+        self.token = str(AccessToken.for_user(self.user))
+
+    def authenticate(self, token=None):
+        request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token or self.token}')
+        return CachedJWTAuthentication().authenticate(request)[0]
+
+    def test_repeat_requests_reuse_the_cached_user(self):
+        self.authenticate()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.authenticate().username, 'analyst')
+
+    def test_new_token_reads_the_user_again(self):
+        self.authenticate()
+        with self.assertNumQueries(1):
+            self.authenticate(str(AccessToken.for_user(self.user)))
+
+    def test_deleted_or_deactivated_user_is_rejected(self):
+        self.authenticate()
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+        self.user.delete()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
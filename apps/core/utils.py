@@ -0,0 +1,106 @@
+import os
+import time
+import uuid
+from datetime import datetime
+from functools import lru_cache
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, Q
+
+def uuid7():
+    """Time-ordered UUID (RFC 9562 version 7) so new rows append to the end of the PK index"""
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), 'big')
+    
+    # Stamp version 7 and the RFC 4122 variant bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+# Last formatted second as one (t, s) tuple, replaced whole so threads never see a torn pair
+_TS_CACHE = (None, '')
+
+def now_iso():
+    """Local time as an ISO 8601 string, formatted at most once per second"""
+    global _TS_CACHE
+    t = int(time.time())
+    cached_t, s = _TS_CACHE
+    if t != cached_t:
+        s = datetime.fromtimestamp(t).isoformat()
+        _TS_CACHE = (t, s)
+    return s
+
+# Constant service block of the status endpoints, shared by every response (read-only)
+SERVICES_HEALTH = {
+    'api': 'healthy',
+    'authentication': 'healthy',
+    'security_monitor': 'healthy'
+}
+
+# Seconds a worker reuses its table list before reading the catalog again
+TABLES_TTL = 10
+
+@lru_cache(maxsize=4)
+def _table_names(bucket):
+    # Backend-neutral (sqlite_master on SQLite, the schema catalog on PostgreSQL)
+    with connection.cursor() as cursor:
+        return tuple(connection.introspection.table_names(cursor))
+
+def table_names():
+    """Database table names, rescanned at most once per TABLES_TTL seconds per worker"""
+    return _table_names(int(time.time()) // TABLES_TTL)
+
+def database_alive():
+    """Open (or reuse) the database connection without running a query"""
+    try:
+        connection.ensure_connection()
+        return True
+    except Exception:
+        return False
+
+def _count_users():
+    from django.contrib.auth import get_user_model
+    return get_user_model().objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(is_active=True)),
+        admins=Count('id', filter=Q(is_superuser=True))
+    )
+
+def cached_user_counts():
+    """Total/active/admin user counts in one query, shared by the status endpoints for 30 seconds"""
+    return cache.get_or_set('user_counts', _count_users, 30)
+
+def fast_count(model):
+    """Row count from planner statistics on PostgreSQL (O(1)), exact COUNT(*) elsewhere"""
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            # regclass resolves the table through search_path, unlike a relname match
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [connection.ops.quote_name(model._meta.db_table)]
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 (or 0) until the table has been vacuumed/analyzed with rows in it
+        if row and row[0] > 0:
+            return row[0]
+    return model.objects.count()
+
+def clear_tables(*models):
+    """Empty whole tables with one DELETE each, skipping the ORM collector (no signals or cascades)"""
+    with connection.cursor() as cursor:
+        for model in models:
+            cursor.execute(f'DELETE FROM {connection.ops.quote_name(model._meta.db_table)}')
+
+def bulk_insert_events(model, rows, batch_size=500):
+    """Insert append-only log rows (list of field dicts) in batches within one transaction"""
+    objects = [model(**row) for row in rows]
+    
+    with transaction.atomic():
+        if connection.vendor == 'postgresql':
+            # Telemetry can afford to lose the last commit on a crash
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL synchronous_commit = OFF')
+        model.objects.bulk_create(objects, batch_size=batch_size)
+    
+    return len(objects)
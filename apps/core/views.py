@@ -1,8 +1,16 @@
-from rest_framework import viewsets, permissions
+from collections import Counter
+from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import CharField, Count, F, Q, Value
+from django.db.models.functions import Extract
+from apps.analytics.models import UserActivity
+from apps.analytics.serializers import UserActivityDetailSerializer, UserActivitySerializer
+from .mixins import DateFilterMixin, ListDetailSerializerMixin
 from .models import Product
+from .utils import fast_count
 
 User = get_user_model()
 
@@ -13,39 +21,153 @@ class ProductViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def dashboard_stats(self, request):
         """Get general dashboard statistics"""
-        return Response({
-            'total_products': Product.objects.count(),
-            'total_users': User.objects.count(),
-            'active_users': User.objects.filter(is_active=True).count(),
+        return Response(cache.get_or_set('dashboard_stats', self._compute_dashboard_stats, 15))
+    
+    def _compute_dashboard_stats(self):
+        # Both user counts come back from a single aggregate query
+        user_counts = User.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True))
+        )
+        
+        return {
+            'total_products': fast_count(Product),
+            'total_users': user_counts['total'],
+            'active_users': user_counts['active'],
             'orders_today': 1847,
             'revenue_today': 85000.50,
             'target_orders': 3000
-        })
+        }
 
-class UserActivityViewSet(viewsets.ModelViewSet):
+class UserActivityViewSet(DateFilterMixin, ListDetailSerializerMixin, viewsets.ModelViewSet):
     """Handle user activity and audit logs"""
+    queryset = UserActivity.objects.select_related('user').order_by('-timestamp')
+    serializer_class = UserActivityDetailSerializer
+    list_serializer_class = UserActivitySerializer
     permission_classes = [permissions.IsAuthenticated]
     
-    def get_queryset(self):
-        from apps.analytics.models import UserActivity
-        return UserActivity.objects.all()
-    
     @action(detail=False, methods=['get'])
     def recent_activity(self, request):
         """Get recent user activity for audit logs"""
         from apps.security.models import SecurityEvent
         
-        recent_events = SecurityEvent.objects.order_by('-timestamp')[:50]
+        recent_events = SecurityEvent.objects.all()
+        
+        # Keyset pagination: ?before=<X-Next-Cursor> continues after the last page; the
+        # cursor is "<timestamp>,<id>" so events sharing a timestamp are not skipped
+        cursor = request.GET.get('before')
+        if cursor:
+            after_cursor = self.keyset_filter(cursor)
+            if after_cursor is None:
+                return Response(
+                    {'error': 'before must be an X-Next-Cursor value'}, status=status.HTTP_400_BAD_REQUEST
+                )
+            recent_events = recent_events.filter(after_cursor)
+        
+        # Rename columns in the SELECT so rows come back in the response shape
+        activity_log = list(recent_events.annotate(
+            user=Value('system'),
+            action=F('event_type'),
+            ip_address=F('source_ip')
+        ).order_by('-timestamp', '-id').values(
+            'id', 'timestamp', 'user', 'action', 'details', 'ip_address', 'severity'
+        )[:50])
+        
+        headers = {}
+        if len(activity_log) == 50:
+            headers['X-Next-Cursor'] = self.make_cursor(activity_log[-1])
+        
+        return Response(activity_log, headers=headers)
+    
+    @action(detail=False, methods=['get'])
+    def audit_log(self, request):
+        """Get the latest user activities and security events for audit logs with date filtering"""
+        from apps.security.models import SecurityEvent
+        
+        date_filters = self.get_date_filter(request)
+        
+        # Both sources merged, sorted and limited by one UNION ALL; the projections
+        # must line up column for column. The username comes from the joined user row
+        activities = UserActivity.objects.filter(**date_filters).values(
+            'id', 'timestamp', 'details',
+            source=Value('user'),
+            actor=F('user__username'),
+            action=F('event_type'),
+            ip=F('ip_address'),
+            level=Value(None, output_field=CharField())
+        )
+        security_events = SecurityEvent.objects.filter(**date_filters).values(
+            'id', 'timestamp', 'details',
+            source=Value('security'),
+            actor=Value('system'),
+            action=F('event_type'),
+            ip=F('source_ip'),
+            level=F('severity')
+        )
+        rows = activities.union(security_events, all=True).order_by('-timestamp')[:50]
         
         activity_log = []
-        for event in recent_events:
-            activity_log.append({
-                'timestamp': event.timestamp.isoformat(),
-                'user': 'system',
-                'action': event.event_type,
-                'details': event.details,
-                'ip_address': event.source_ip,
-                'severity': event.severity
-            })
-        
-        return Response(activity_log)
+        sources = Counter()
+        for row in rows:
+            sources[row['source']] += 1
+            entry = {
+                'id': row['id'],
+                'timestamp': row['timestamp'],
+                'user': row['actor'],
+                'action': row['action'],
+                'details': row['details'],
+                'ip_address': row['ip']
+            }
+            if row['source'] == 'security':
+                entry['severity'] = row['level']
+            activity_log.append(entry)
+        
+        return Response({
+            'activities': activity_log,
+            'total_user_activities': sources['user'],
+            'total_security_events': sources['security']
+        })
+    
+    @action(detail=False, methods=['get'])
+    def activity_summary(self, request):
+        """Get user activity summary and statistics"""
+        date_filters = self.get_date_filter(request)
+        
+        activities = UserActivity.objects.filter(**date_filters)
+        
+        # Totals in one statement
+        totals = activities.aggregate(
+            total=Count('id'),
+            unique_users=Count('user', distinct=True)
+        )
+        
+        # Activity by type
+        by_type = activities.values('event_type').annotate(
+            count=Count('id')
+        ).order_by('-count')
+        
+        # Activity by user
+        by_user = activities.values('user__username').annotate(
+            count=Count('id')
+        ).order_by('-count')
+        
+        # Activity by hour
+        by_hour = activities.annotate(
+            hour=Extract('timestamp', 'hour')
+        ).values('hour').annotate(
+            count=Count('id')
+        ).order_by('hour')
+        
+        return Response({
+            'summary': {
+                'total_activities': totals['total'],
+                'unique_users': totals['unique_users'],
+                'by_type': list(by_type),
+                'by_user': list(by_user),
+                'by_hour': list(by_hour)
+            },
+            'period': {
+                'start': request.GET.get('start_date', 'Last 7 days'),
+                'end': request.GET.get('end_date', 'Now')
+            }
+        })
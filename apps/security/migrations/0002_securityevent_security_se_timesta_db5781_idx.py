@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('security', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='securityevent',
+            index=models.Index(fields=['-timestamp'], name='security_se_timesta_db5781_idx'),
+        ),
+    ]
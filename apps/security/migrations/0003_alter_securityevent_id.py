@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:48
+
+import apps.core.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('security', '0002_securityevent_security_se_timesta_db5781_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='securityevent',
+            name='id',
+            field=models.UUIDField(default=apps.core.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:49
+
+import json
+
+from django.db import migrations, models
+
+
+BATCH_SIZE = 500
+
+
+def rewrite_details(SecurityEvent, convert):
+    """Stream every row and write the converted details back one batch at a time"""
+    batch = []
+    for event in SecurityEvent.objects.only('id', 'details').iterator(chunk_size=BATCH_SIZE):
+        event.details = convert(event.details)
+        batch.append(event)
+        if len(batch) == BATCH_SIZE:
+            SecurityEvent.objects.bulk_update(batch, ['details'])
+            batch = []
+    if batch:
+        SecurityEvent.objects.bulk_update(batch, ['details'])
+
+
+def encode_details(apps, schema_editor):
+    """Wrap the existing free-form text in JSON objects so the column can become JSON"""
+    SecurityEvent = apps.get_model('security', 'SecurityEvent')
+    rewrite_details(SecurityEvent, lambda text: json.dumps({'message': text}))
+
+
+def decode_message(value):
+    value = json.loads(value)
+    if isinstance(value, dict) and value.keys() == {'message'}:
+        return value['message']
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def decode_details(apps, schema_editor):
+    SecurityEvent = apps.get_model('security', 'SecurityEvent')
+    rewrite_details(SecurityEvent, decode_message)
+
+
+def create_details_gin_index(apps, schema_editor):
+    # GIN is PostgreSQL-only; SQLite keeps working without it
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS security_se_details_gin '
+            'ON security_securityevent USING GIN (details jsonb_path_ops)'
+        )
+
+
+def drop_details_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS security_se_details_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('security', '0003_alter_securityevent_id'),
+    ]
+
+    operations = [
+        migrations.RunPython(encode_details, decode_details),
+        migrations.AlterField(
+            model_name='securityevent',
+            name='details',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.AddIndex(
+            model_name='securityevent',
+            index=models.Index(fields=['-timestamp', 'severity'], name='security_se_timesta_f2bcbd_idx'),
+        ),
+        migrations.RunPython(create_details_gin_index, drop_details_gin_index),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:51
+
+from django.db import migrations
+
+
+def create_brin_index(apps, schema_editor):
+    # BRIN is PostgreSQL-only; the B-tree indexes still serve ORDER BY ... LIMIT
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS se_ts_brin ON security_securityevent USING BRIN (timestamp)'
+        )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS se_ts_brin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('security', '0004_securityevent_details_json'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_index, drop_brin_index),
+    ]
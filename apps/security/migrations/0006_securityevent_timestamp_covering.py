@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-16 01:12
+
+from django.db import migrations
+
+
+def create_covering_index(apps, schema_editor):
+    # INCLUDE is PostgreSQL-only; recent_activity pages are found and ordered from the index,
+    # but details is not included, so each of the 50 rows is still fetched from the table
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS se_ts_cover ON security_securityevent '
+            '(timestamp DESC) INCLUDE (event_type, severity, source_ip)'
+        )
+
+
+def drop_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS se_ts_cover')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('security', '0005_securityevent_timestamp_brin'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_covering_index, drop_covering_index),
+    ]
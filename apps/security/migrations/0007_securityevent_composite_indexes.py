@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('security', '0006_securityevent_timestamp_covering'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='securityevent',
+            index=models.Index(fields=['-timestamp', 'is_threat'], name='security_se_timesta_9c7459_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='securityevent',
+            index=models.Index(fields=['-timestamp', 'event_type'], name='security_se_timesta_2448d2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='securityevent',
+            index=models.Index(fields=['source_ip', '-timestamp'], name='security_se_source__3d878d_idx'),
+        ),
+    ]
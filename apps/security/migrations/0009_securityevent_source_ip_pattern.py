@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-16 01:31
+
+from django.db import migrations
+
+
+def create_source_ip_pattern_index(apps, schema_editor):
+    # source_ip is inet on PostgreSQL and prefix lookups compare HOST(source_ip),
+    # so the pattern index has to be on that expression
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_secev_source_ip ON security_securityevent '
+            '(HOST(source_ip) text_pattern_ops)'
+        )
+
+
+def drop_source_ip_pattern_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS idx_secev_source_ip')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('security', '0008_device_last_seen_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_source_ip_pattern_index, drop_source_ip_pattern_index),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-16 01:06
+
+from django.db import migrations, models
+
+
+def drop_duplicate_hostnames(apps, schema_editor):
+    # Keep one device per hostname so the unique constraint can be added
+    Device = apps.get_model('security', 'Device')
+    seen = set()
+    duplicate_ids = []
+    for device_id, hostname in Device.objects.order_by('hostname', 'id').values_list('id', 'hostname'):
+        if hostname in seen:
+            duplicate_ids.append(device_id)
+        seen.add(hostname)
+    Device.objects.filter(id__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('security', '0009_securityevent_source_ip_pattern'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_hostnames, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='device',
+            name='hostname',
+            field=models.CharField(max_length=100, unique=True),
+        ),
+    ]
@@ -1,20 +1,31 @@
 from django.db import models
 import uuid
+from apps.core.utils import uuid7
 
 class Device(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    hostname = models.CharField(max_length=100)
+    hostname = models.CharField(max_length=100, unique=True)
     ip_address = models.GenericIPAddressField()
     device_type = models.CharField(max_length=50)
     status = models.CharField(max_length=20, default='active')
     os = models.CharField(max_length=100, blank=True)
     notes = models.TextField(blank=True)
+    last_seen_at = models.DateTimeField(null=True, blank=True, db_index=True)
 
 class SecurityEvent(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     event_type = models.CharField(max_length=50)
     severity = models.CharField(max_length=20)
     source_ip = models.GenericIPAddressField()
     timestamp = models.DateTimeField(auto_now_add=True)
-    details = models.TextField()
+    details = models.JSONField(default=dict)
     is_threat = models.BooleanField(default=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-timestamp']),
+            models.Index(fields=['-timestamp', 'severity']),
+            models.Index(fields=['-timestamp', 'is_threat']),
+            models.Index(fields=['-timestamp', 'event_type']),
+            models.Index(fields=['source_ip', '-timestamp']),
+        ]
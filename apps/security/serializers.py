@@ -2,11 +2,23 @@ from rest_framework import serializers
 from .models import SecurityEvent, Device
 
 class SecurityEventSerializer(serializers.ModelSerializer):
+    """Lean representation for list views"""
     class Meta:
         model = SecurityEvent
-        fields = '__all__'
+        fields = ('id', 'timestamp', 'event_type', 'severity', 'source_ip', 'is_threat')
+
+class SecurityEventDetailSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SecurityEvent
+        fields = ('id', 'timestamp', 'event_type', 'severity', 'source_ip', 'is_threat', 'details')
 
 class DeviceSerializer(serializers.ModelSerializer):
+    """Lean representation for list views"""
+    class Meta:
+        model = Device
+        fields = ('id', 'hostname', 'ip_address', 'device_type', 'status', 'os', 'last_seen_at')
+
+class DeviceDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = Device
-        fields = '__all__'
+        fields = ('id', 'hostname', 'ip_address', 'device_type', 'status', 'os', 'notes', 'last_seen_at')
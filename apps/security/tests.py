@@ -1,3 +1,75 @@
+import csv
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from .models import SecurityEvent
+from .views import SecurityViewSet
+
+
+class SecurityDashboardStatsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username='analyst', password='pass')
+        for severity in ('critical', 'critical', 'low'):
+            SecurityEvent.objects.create(
+                event_type='login_failure', severity=severity, source_ip='10.0.0.1'
+            )
+
+    def get_stats(self):
+        request = APIRequestFactory().get('/api/security/dashboard_stats/')
+        force_authenticate(request, user=self.user)
+        return SecurityViewSet.as_view({'get': 'dashboard_stats'})(request).data
+
+    def test_dashboard_stats_counts_events(self):
+        stats = self.get_stats()
+        self.assertEqual(stats['critical_alerts'], 2)
+        self.assertEqual(stats['failed_logins'], 3)
+        self.assertEqual(stats['total_events'], 3)
+
+
+class ExportEventsTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='analyst', password='pass')
+        SecurityEvent.objects.create(
+            event_type='login_failure', severity='high', source_ip='10.0.0.1', details={'message': 'hi, there'}
+        )
+
+    def test_csv_export_writes_details_as_json(self):
+        request = APIRequestFactory().get('/api/security/export_events/', {'format': 'csv'})
+        force_authenticate(request, user=self.user)
+        view = SecurityViewSet.as_view({'get': 'export_events'}, **SecurityViewSet.export_events.kwargs)
+        response = view(request)
+        header, row = csv.reader(b''.join(response.streaming_content).decode().splitlines())
+        self.assertEqual(json.loads(row[header.index('Details')]), {'message': 'hi, there'})
+
+
+class RecentEventsCursorTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='analyst', password='pass')
+        events = SecurityEvent.objects.bulk_create(
+            SecurityEvent(event_type='scan', severity='low', source_ip='10.0.0.1') for _ in range(120)
+        )
+        # Every event shares one timestamp, so only the id keeps pages apart
+        SecurityEvent.objects.filter(id__in=[event.id for event in events]).update(
+            timestamp=events[0].timestamp
+        )
+
+    def get_page(self, **params):
+        request = APIRequestFactory().get('/api/security/recent_events/', params)
+        force_authenticate(request, user=self.user)
+        return SecurityViewSet.as_view({'get': 'recent_events'})(request)
+
+    def test_cursor_pages_through_equal_timestamps(self):
+        first = self.get_page().data
+        second = self.get_page(after=first['next_cursor']).data
+        self.assertEqual(len(first['events']), 100)
+        self.assertEqual(len(second['events']), 20)
+        ids = {event['id'] for event in first['events'] + second['events']}
+        self.assertEqual(len(ids), 120)
 
-# Create your tests here.
+    def test_malformed_cursor_is_rejected(self):
+        self.assertEqual(self.get_page(after='yesterday').status_code, 400)
@@ -0,0 +1,16 @@
+from apps.core.utils import bulk_insert_events
+from .models import SecurityEvent
+
+# Vulnerability classification from device notes: (severity, risk score, keywords), first match wins
+VULNERABILITY_RULES = (
+    ('critical', 9, ('critical', 'no firewall', 'no antivirus')),
+    ('high', 7, ('outdated', 'ssl', 'tls', 'password')),
+    ('medium', 5, ('update', 'patch', 'config')),
+)
+LOW_RISK = ('low', 3)
+RISK_SEVERITY = {score: severity for severity, score, _ in VULNERABILITY_RULES}
+RISK_SEVERITY[LOW_RISK[1]] = LOW_RISK[0]
+
+def log_security_events_bulk(rows, batch_size=500):
+    """Record many SecurityEvent rows with batched INSERTs instead of one save() each"""
+    return bulk_insert_events(SecurityEvent, rows, batch_size)
@@ -65,9 +65,28 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Reuse connections across requests; health checks drop stale ones
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# PostgreSQL (psycopg 3) when FINMARK_DB_NAME is set
+if os.environ.get('FINMARK_DB_NAME'):
+    DATABASES['default'].update({
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ['FINMARK_DB_NAME'],
+        'USER': os.environ.get('FINMARK_DB_USER', 'postgres'),
+        'PASSWORD': os.environ.get('FINMARK_DB_PASSWORD', ''),
+        'HOST': os.environ.get('FINMARK_DB_HOST', 'localhost'),
+        'PORT': os.environ.get('FINMARK_DB_PORT', '5432'),
+        # Server-side parameter binding lets Postgres reuse prepared plans
+        'OPTIONS': {'server_side_binding': True},
+    })
+    # Behind pgbouncer in transaction mode, named cursors can't span transactions
+    if os.environ.get('FINMARK_DB_PGBOUNCER'):
+        DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+
 # Custom User Model
 AUTH_USER_MODEL = 'core.User'
 
@@ -84,6 +103,12 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Throwaway test/demo databases only: MD5 instead of PBKDF2 so seeding users and
+# auth smoke tests skip the deliberate hashing cost. These hashes stop verifying
+# once the flag is unset.
+if os.environ.get('FINMARK_FAST_HASH'):
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
@@ -114,12 +139,15 @@ CORS_ALLOW_CREDENTIALS = True
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.core.authentication.CachedJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'apps.core.renderers.ORJSONRenderer',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 50,
     'DEFAULT_FILTER_BACKENDS': [
@@ -232,6 +260,12 @@ CACHES = {
         'OPTIONS': {
             'MAX_ENTRIES': 1000,
         }
+    },
+    # Per-process cache for hot per-request lookups (JWT users); no DB round-trip
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'finmark-local',
+        'TIMEOUT': 60,
     }
 }
 
@@ -267,14 +301,14 @@ FINMARK_MILESTONE = 'Milestone 2 - Security Analytics Dashboard'
 # REST Framework configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.core.authentication.CachedJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'apps.core.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20
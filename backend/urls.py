@@ -1,122 +1,195 @@
 # backend/urls.py - FinMark with PUBLIC API endpoints
 from django.contrib import admin
-from django.urls import path
-from rest_framework_simplejwt.views import (
-    TokenObtainPairView,
-    TokenRefreshView,
-    TokenVerifyView,
-)
+from django.urls import include, path
+from django.utils.module_loading import import_string
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
+from django.http import HttpResponse, StreamingHttpResponse
+from django.views.decorators.cache import cache_control, cache_page
+from django.views.decorators.http import etag, require_safe
+from apps.core.renderers import dumps
+from apps.core.utils import SERVICES_HEALTH, cached_user_counts, database_alive, now_iso, table_names
 from datetime import datetime
+from functools import lru_cache
 import random
+import time
 
-@api_view(['GET'])
-@permission_classes([AllowAny])  # PUBLIC - No auth required
+def lazy_view(dotted_path):
+    """Import a class-based view on its first request instead of at URLconf load"""
+    @lru_cache(maxsize=None)
+    def get_view():
+        return import_string(dotted_path).as_view()
+    
+    # API views are CSRF exempt; the wrapper has to say so before the view is imported
+    @csrf_exempt
+    def view(request, *args, **kwargs):
+        return get_view()(request, *args, **kwargs)
+    return view
+
+# Longer table lists are streamed instead of rendered into one buffer; streamed
+# responses bypass cache_page, so normal-sized schemas keep the cached path
+STREAM_TABLES_THRESHOLD = 500
+
+def _stream_database_info(info, tables):
+    """Yield the api_database body, emitting the table list one name at a time"""
+    yield dumps(info)[:-1] + b',"tables":['
+    for index, name in enumerate(tables):
+        yield (b',' if index else b'') + dumps(name)
+    yield b']}'
+
+# Seconds api_status responses are cached and share one ETag
+STATUS_CACHE_SECONDS = 30
+
+def _status_etag(request):
+    """Weak ETag per api_status cache window (bodies inside one differ only in timestamp)"""
+    return f'W/"status-{int(time.time()) // STATUS_CACHE_SECONDS}"'
+
+# Demo metrics are drawn once at import; api_metrics shows one sample per bucket
+METRICS_RING_SIZE = 1024
+METRICS_BUCKET_SECONDS = 5
+_METRICS_RING = [
+    (
+        random.randint(0, 5),
+        random.randint(8, 15),
+        random.randint(15, 35),
+        round(random.uniform(95, 99.5), 1),
+        random.randint(1500, 2500),
+    )
+    for _ in range(METRICS_RING_SIZE)
+]
+
+def _metrics_bucket():
+    return int(time.time()) // METRICS_BUCKET_SECONDS
+
+def _metrics_etag(request):
+    """Weak ETag for the current metrics bucket"""
+    return f'W/"metrics-{_metrics_bucket()}"'
+
+# api_root's body is static apart from the timestamp, so it is encoded once here
+_API_ROOT_PREFIX = dumps({
+    'message': 'FinMark Security Operations Center API',
+    'version': '1.0.0',
+    'status': 'operational',
+    'endpoints': {
+        'auth': '/api/auth/token/',
+        'status': '/api/status/',
+        'metrics': '/api/metrics/',
+        'database': '/api/database/',
+        'health': '/api/health/',
+    }
+})[:-1] + b',"timestamp":"'
+_API_ROOT_SUFFIX = b'"}'
+
+@lru_cache(maxsize=1)
+def _api_root_body(timestamp):
+    # now_iso() changes once per second, so the full body is assembled at most once per second
+    return _API_ROOT_PREFIX + timestamp.encode() + _API_ROOT_SUFFIX
+
+@require_safe  # PUBLIC - No auth required; skips DRF's request/renderer pipeline
 def api_root(request):
     """API root endpoint - PUBLIC"""
-    return Response({
-        'message': 'FinMark Security Operations Center API',
-        'timestamp': datetime.now().isoformat(),
-        'version': '1.0.0',
-        'status': 'operational',
-        'endpoints': {
-            'auth': '/api/auth/token/',
-            'status': '/api/status/',
-            'metrics': '/api/metrics/',
-            'database': '/api/database/',
-        }
-    })
+    return HttpResponse(_api_root_body(now_iso()), content_type='application/json')
+
+@require_safe  # PUBLIC heartbeat; HEAD works too
+def api_health(request):
+    """Liveness probe - no database, cache or DRF work"""
+    return HttpResponse(b'{"ok":1}', content_type='application/json')
 
+@etag(_status_etag)  # Polls within one cache window get a 304
+@cache_page(STATUS_CACHE_SECONDS)  # Dashboard polls this; table metadata rarely changes
 @api_view(['GET'])
 @permission_classes([AllowAny])  # PUBLIC - No auth required
 def api_status(request):
     """System status endpoint - PUBLIC"""
-    try:
-        from django.db import connection
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
-            db_connected = True
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in cursor.fetchall()]
-    except Exception as e:
-        db_connected = False
-        tables = []
-        print(f"Database error: {e}")
+    # Liveness without a SELECT 1; the table list comes from the per-worker snapshot
+    db_connected = database_alive()
+    tables = table_names() if db_connected else ()
     
     return Response({
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now_iso(),
         'status': 'online',
         'database': {
             'connected': db_connected,
             'tables_count': len(tables),
             'status': 'healthy' if db_connected else 'error'
         },
-        'services': {
-            'api': 'healthy',
-            'authentication': 'healthy',
-            'security_monitor': 'healthy'
-        }
+        'services': SERVICES_HEALTH
     })
 
+@cache_control(public=True, max_age=METRICS_BUCKET_SECONDS)
+@etag(_metrics_etag)  # Repeat polls within the same bucket get a 304
 @api_view(['GET'])
 @permission_classes([AllowAny])  # PUBLIC - No auth required
 def api_metrics(request):
     """Security metrics endpoint - PUBLIC"""
+    bucket = _metrics_bucket()
+    critical, threats, failed, health, orders = _METRICS_RING[bucket % METRICS_RING_SIZE]
     return Response({
-        'critical_alerts': random.randint(0, 5),
-        'active_threats': random.randint(8, 15),
-        'failed_logins': random.randint(15, 35),
-        'system_health': round(random.uniform(95, 99.5), 1),
-        'daily_orders': random.randint(1500, 2500),
-        'timestamp': datetime.now().isoformat()
+        'critical_alerts': critical,
+        'active_threats': threats,
+        'failed_logins': failed,
+        'system_health': health,
+        'daily_orders': orders,
+        'timestamp': datetime.fromtimestamp(bucket * METRICS_BUCKET_SECONDS).isoformat()
     })
 
+@cache_page(30)  # Dashboard polls this; table metadata rarely changes
 @api_view(['GET'])
 @permission_classes([AllowAny])  # PUBLIC - No auth required
 def api_database(request):
     """Database information endpoint - PUBLIC"""
     try:
-        from django.db import connection
-        from django.contrib.auth import get_user_model
-        
-        User = get_user_model()
-        
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in cursor.fetchall()]
-        
-        return Response({
+        tables = table_names()
+        user_counts = cached_user_counts()
+        info = {
             'database_connected': True,
             'database_path': 'db.sqlite3',
-            'tables': tables,
             'table_count': len(tables),
-            'users_count': User.objects.count(),
-            'last_check': datetime.now().isoformat()
-        })
+            'users_count': user_counts['total'],
+            'active_users_count': user_counts['active'],
+            'admin_users_count': user_counts['admins'],
+            'last_check': now_iso()
+        }
+        
+        if len(tables) > STREAM_TABLES_THRESHOLD:
+            return StreamingHttpResponse(
+                _stream_database_info(info, tables),
+                content_type='application/json'
+            )
+        
+        return Response({**info, 'tables': list(tables)})
     except Exception as e:
         return Response({
             'database_connected': False,
             'error': str(e),
-            'last_check': datetime.now().isoformat()
+            'last_check': now_iso()
         }, status=500)
 
 # URL Patterns
-urlpatterns = [
-    # Django Admin
-    path('admin/', admin.site.urls),
-    
-    # PUBLIC API Root
-    path('api/', api_root, name='api_root'),
-    
+# Grouped under include() so the resolver skips a whole branch when its prefix does not match
+auth_patterns = [
     # JWT Authentication Endpoints
-    path('api/auth/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
-    path('api/auth/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
-    path('api/auth/token/verify/', TokenVerifyView.as_view(), name='token_verify'),
+    path('token/', lazy_view('rest_framework_simplejwt.views.TokenObtainPairView'), name='token_obtain_pair'),
+    path('token/refresh/', lazy_view('rest_framework_simplejwt.views.TokenRefreshView'), name='token_refresh'),
+    path('token/verify/', lazy_view('rest_framework_simplejwt.views.TokenVerifyView'), name='token_verify'),
+]
+
+api_patterns = [
+    # PUBLIC API Root
+    path('', api_root, name='api_root'),
     
     # PUBLIC API Endpoints (Dashboard can access without login)
-    path('api/status/', api_status, name='api_status'),
-    path('api/metrics/', api_metrics, name='api_metrics'),
-    path('api/database/', api_database, name='api_database'),
+    path('status/', api_status, name='api_status'),
+    path('metrics/', api_metrics, name='api_metrics'),
+    path('database/', api_database, name='api_database'),
+    path('health/', api_health, name='api_health'),
+]
+
+urlpatterns = [
+    # Django Admin
+    path('admin/', admin.site.urls),
+    path('api/auth/', include(auth_patterns)),
+    path('api/', include(api_patterns)),
 ]
@@ -4,7 +4,8 @@ Cleanup script for temporary Python files used during development
 """
 
 import os
-import glob
+import fnmatch
+import shutil
 from pathlib import Path
 
 def cleanup_temp_files():
@@ -25,14 +26,15 @@ def cleanup_temp_files():
         'create_*.py',
         'setup_*.py',
         'load_*.py',  # But keep load_csv_data.py if it exists
-        '__pycache__/*',
         '*.pyc',
         '*.pyo',
-        '.pytest_cache/*',
         '.coverage',
         '*.log'
     ]
     
+    # Directories whose contents are removed
+    temp_dirs = ['__pycache__', '.pytest_cache']
+    
     # Files to keep (important ones)
     keep_files = [
         'manage.py',
@@ -44,30 +46,48 @@ def cleanup_temp_files():
     
     files_removed = 0
     
-    for pattern in temp_patterns:
-        for file_path in glob.glob(pattern, recursive=True):
-            filename = os.path.basename(file_path)
-            
-            # Don't remove important files
-            if filename in keep_files:
-                continue
-                
-            # Don't remove files in important directories
-            if any(important in file_path for important in ['apps/', 'backend/', 'dashboard/']):
-                continue
+    def is_temp(name):
+        # Like glob, only patterns starting with '.' match hidden names
+        hidden = name.startswith('.')
+        return any(
+            fnmatch.fnmatch(name, pattern)
+            for pattern in temp_patterns
+            if pattern.startswith('.') == hidden
+        )
+    
+    # One scan of the project root instead of a glob per pattern
+    candidates = []
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name in temp_dirs and entry.is_dir():
+                with os.scandir(entry.path) as children:
+                    candidates.extend(child for child in children if not child.name.startswith('.'))
+            elif is_temp(entry.name):
+                candidates.append(entry)
+    
+    for entry in candidates:
+        file_path = entry.path
+        
+        # Don't remove important files
+        if entry.name in keep_files:
+            continue
             
-            try:
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-                    print(f"🗑️ Removed: {file_path}")
-                    files_removed += 1
-                elif os.path.isdir(file_path):
-                    import shutil
-                    shutil.rmtree(file_path)
-                    print(f"🗑️ Removed directory: {file_path}")
-                    files_removed += 1
-            except Exception as e:
-                print(f"⚠️ Could not remove {file_path}: {e}")
+        # Don't remove files in important directories
+        if any(important in file_path for important in ['apps/', 'backend/', 'dashboard/']):
+            continue
+        
+        try:
+            # DirEntry type checks reuse the stat data from the scan
+            if entry.is_file():
+                os.remove(file_path)
+                print(f"🗑️ Removed: {file_path}")
+                files_removed += 1
+            elif entry.is_dir():
+                shutil.rmtree(file_path)
+                print(f"🗑️ Removed directory: {file_path}")
+                files_removed += 1
+        except Exception as e:
+            print(f"⚠️ Could not remove {file_path}: {e}")
     
     # Remove empty directories
     for root, dirs, files in os.walk('.', topdown=False):
@@ -1,57 +1,73 @@
 # dashboard/views.py
 from django.http import JsonResponse
-from django.contrib.auth import get_user_model
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework import status
-from django.db import connection
-from datetime import datetime, timedelta
+from django.core.cache import caches
+from apps.core.authentication import USER_CACHE_TTL, profile_cache_key
+from apps.core.utils import SERVICES_HEALTH, cached_user_counts, database_alive, now_iso, table_names
+from datetime import datetime
+from functools import lru_cache
 import os
 import random
+import time
 
-User = get_user_model()
+# Data files reported by csv_data_status, relative to the working directory
+CSV_FILES = (
+    'event_logs.csv',
+    'marketing_summary.csv',
+    'trend_report.csv',
+    'network_inventory.csv',
+    'traffic_logs.csv',
+)
+
+# Seconds each random security_metrics sample is served for
+METRICS_BUCKET_SECONDS = 5
+
+# Resolved once at import; the SQLite file does not move while the server runs
+DB_PATH = os.path.join(os.getcwd(), 'db.sqlite3')
+
+def _db_size():
+    """Size of the SQLite file from a single stat, or None when it is missing"""
+    try:
+        return os.stat(DB_PATH).st_size
+    except OSError:
+        return None
+
+@lru_cache(maxsize=16)
+def _minutes_ago_iso(second, minutes):
+    return datetime.fromtimestamp(second - minutes * 60).isoformat()
+
+def minutes_ago_iso(minutes):
+    """ISO timestamp for `minutes` ago, formatted once per second (like now_iso)"""
+    return _minutes_ago_iso(int(time.time()), minutes)
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def system_status(request):
     """Return comprehensive system status"""
-    try:
-        # Test database connection
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
-            db_connected = True
-            
-            # Get database info
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in cursor.fetchall()]
-            
-    except Exception as e:
-        db_connected = False
-        tables = []
+    # Test database connection without a query; tables come from the per-worker snapshot
+    db_connected = database_alive()
+    tables = table_names() if db_connected else ()
     
     # Check database file
-    db_path = os.path.join(os.getcwd(), 'db.sqlite3')
-    db_exists = os.path.exists(db_path)
+    db_exists = _db_size() is not None
     
     return Response({
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now_iso(),
         'status': 'online',
         'database': {
             'connected': db_connected,
-            'path': db_path,
+            'path': DB_PATH,
             'exists': db_exists,
             'tables': len(tables),
             'status': 'healthy' if db_connected else 'error'
         },
-        'services': {
-            'api': 'healthy',
-            'authentication': 'healthy',
-            'security_monitor': 'healthy'
-        },
+        'services': SERVICES_HEALTH,
         'metrics': {
             'uptime': '99.8%',
-            'active_users': User.objects.count(),
+            'active_users': cached_user_counts()['total'],
             'total_requests': random.randint(1000, 5000)
         }
     })
@@ -60,50 +76,52 @@ def system_status(request):
 @permission_classes([IsAuthenticated])
 def security_metrics(request):
     """Return security metrics - requires authentication"""
-    return Response({
+    bucket = int(time.time()) // METRICS_BUCKET_SECONDS
+    return Response({**_security_metrics_sample(bucket), 'timestamp': now_iso()})
+
+@lru_cache(maxsize=1)
+def _security_metrics_sample(bucket):
+    """Demo metrics drawn once per bucket and shared by every request in it"""
+    return {
         'critical_alerts': random.randint(0, 5),
         'active_threats': random.randint(5, 20),
         'failed_logins': random.randint(10, 50),
         'system_health': round(random.uniform(95, 99.9), 1),
         'successful_logins': random.randint(100, 500),
         'data_transferred': f"{random.uniform(1.0, 5.0):.1f}TB",
-        'daily_orders': random.randint(1500, 2500),
-        'timestamp': datetime.now().isoformat()
-    })
+        'daily_orders': random.randint(1500, 2500)
+    }
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def database_info(request):
     """Return detailed database information"""
     try:
-        with connection.cursor() as cursor:
-            # Get all tables
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in cursor.fetchall()]
-            
-            # Get user count
-            user_count = User.objects.count()
-            
-            # Get database size (approximate)
-            db_path = os.path.join(os.getcwd(), 'db.sqlite3')
-            db_size = os.path.getsize(db_path) if os.path.exists(db_path) else 0
-            
+        # Get all tables
+        tables = list(table_names())
+        
+        # Get user count
+        user_count = cached_user_counts()['total']
+        
+        # Get database size (approximate)
+        db_size = _db_size() or 0
+        
         return Response({
             'database_connected': True,
-            'database_path': db_path,
+            'database_path': DB_PATH,
             'database_size_bytes': db_size,
             'database_size_mb': round(db_size / (1024 * 1024), 2),
             'tables': tables,
             'table_count': len(tables),
             'users_count': user_count,
-            'last_check': datetime.now().isoformat()
+            'last_check': now_iso()
         })
         
     except Exception as e:
         return Response({
             'database_connected': False,
             'error': str(e),
-            'last_check': datetime.now().isoformat()
+            'last_check': now_iso()
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 @api_view(['GET'])
@@ -112,7 +130,13 @@ def user_profile(request):
     """Return current user profile information"""
     user = request.user
     
-    return Response({
+    # Built once per user per worker; saving the user clears it (apps.core.signals)
+    return Response(caches['local'].get_or_set(
+        profile_cache_key(user.pk), lambda: build_user_profile(user), USER_CACHE_TTL
+    ))
+
+def build_user_profile(user):
+    return {
         'id': user.id,
         'username': user.username,
         'email': user.email,
@@ -130,32 +154,29 @@ def user_profile(request):
             'can_view_admin_functions': user.is_superuser,
             'can_manage_users': user.is_superuser
         }
-    })
+    }
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def csv_data_status(request):
     """Check status of CSV data files"""
-    csv_files = [
-        'event_logs.csv',
-        'marketing_summary.csv', 
-        'trend_report.csv',
-        'network_inventory.csv',
-        'traffic_logs.csv'
-    ]
+    # One directory scan instead of exists/getsize/getmtime per file
+    with os.scandir('.') as entries:
+        found = {entry.name: entry.stat() for entry in entries if entry.name in CSV_FILES and entry.is_file()}
     
     file_status = {}
     total_size = 0
     
-    for csv_file in csv_files:
-        if os.path.exists(csv_file):
-            file_size = os.path.getsize(csv_file)
+    for csv_file in CSV_FILES:
+        stat = found.get(csv_file)
+        if stat:
+            file_size = stat.st_size
             total_size += file_size
             file_status[csv_file] = {
                 'exists': True,
                 'size_bytes': file_size,
                 'size_kb': round(file_size / 1024, 2),
-                'last_modified': datetime.fromtimestamp(os.path.getmtime(csv_file)).isoformat()
+                'last_modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
             }
         else:
             file_status[csv_file] = {
@@ -170,13 +191,13 @@ def csv_data_status(request):
     return Response({
         'csv_files': file_status,
         'summary': {
-            'total_files': len(csv_files),
+            'total_files': len(CSV_FILES),
             'available_files': available_files,
-            'missing_files': len(csv_files) - available_files,
+            'missing_files': len(CSV_FILES) - available_files,
             'total_size_bytes': total_size,
             'total_size_mb': round(total_size / (1024 * 1024), 2)
         },
-        'last_check': datetime.now().isoformat()
+        'last_check': now_iso()
     })
 
 @api_view(['GET'])
@@ -185,7 +206,7 @@ def api_health(request):
     """Simple health check endpoint"""
     return Response({
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now_iso(),
         'version': '1.0.0',
         'service': 'FinMark Security API'
     })
@@ -202,7 +223,7 @@ def test_auth(request):
             'is_superuser': request.user.is_superuser
         },
         'message': 'Authentication successful',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': now_iso()
     })
 
 # Additional utility endpoints
@@ -218,19 +239,19 @@ def system_logs(request):
     # Mock log data
     logs = [
         {
-            'timestamp': (datetime.now() - timedelta(minutes=5)).isoformat(),
+            'timestamp': minutes_ago_iso(5),
             'level': 'INFO',
             'message': 'User login successful',
             'user': request.user.username
         },
         {
-            'timestamp': (datetime.now() - timedelta(minutes=15)).isoformat(),
+            'timestamp': minutes_ago_iso(15),
             'level': 'WARNING',
             'message': 'Failed login attempt detected',
             'ip': '192.168.1.45'
         },
         {
-            'timestamp': (datetime.now() - timedelta(minutes=30)).isoformat(),
+            'timestamp': minutes_ago_iso(30),
             'level': 'INFO',
             'message': 'System backup completed',
             'status': 'success'
@@ -240,7 +261,7 @@ def system_logs(request):
     return Response({
         'logs': logs,
         'total': len(logs),
-        'last_update': datetime.now().isoformat()
+        'last_update': now_iso()
     })
 
 @api_view(['GET'])
@@ -258,7 +279,7 @@ def security_alerts(request):
             'severity': 'critical',
             'title': 'Multiple Failed Login Attempts',
             'description': 'Detected multiple failed login attempts from IP 192.168.1.45',
-            'timestamp': (datetime.now() - timedelta(minutes=2)).isoformat(),
+            'timestamp': minutes_ago_iso(2),
             'status': 'active'
         },
         {
@@ -266,7 +287,7 @@ def security_alerts(request):
             'severity': 'warning',
             'title': 'Unusual Traffic Pattern',
             'description': 'Unusual traffic pattern detected on network interface',
-            'timestamp': (datetime.now() - timedelta(minutes=8)).isoformat(),
+            'timestamp': minutes_ago_iso(8),
             'status': 'investigating'
         },
         {
@@ -274,7 +295,7 @@ def security_alerts(request):
             'severity': 'info',
             'title': 'System Update',
             'description': 'Security definitions updated successfully',
-            'timestamp': (datetime.now() - timedelta(minutes=15)).isoformat(),
+            'timestamp': minutes_ago_iso(15),
             'status': 'resolved'
         }
     ]
@@ -287,5 +308,5 @@ def security_alerts(request):
             'info': len([a for a in alerts if a['severity'] == 'info']),
             'active': len([a for a in alerts if a['status'] == 'active'])
         },
-        'last_update': datetime.now().isoformat()
+        'last_update': now_iso()
     })
\ No newline at end of file
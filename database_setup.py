@@ -6,12 +6,26 @@ Loads your CSV data into SQLite database with proper date handling
 
 import os
 import sys
-import django
-import pandas as pd
-import numpy as np
+import importlib.util
 from datetime import datetime, timedelta
 import json
 import random
+from concurrent.futures import ThreadPoolExecutor
+
+def preflight():
+    """Exit before the Django/pandas imports when they cannot succeed"""
+    if not os.path.exists('manage.py'):
+        sys.exit("❌ manage.py not found - run this script from the project root")
+    for module in ('django', 'pandas', 'numpy'):
+        if importlib.util.find_spec(module) is None:
+            sys.exit(f"❌ {module} is not installed - run: pip install -r requirements.txt")
+
+if __name__ == '__main__':
+    preflight()
+
+import django
+import pandas as pd
+import numpy as np
 
 # Setup Django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
@@ -21,6 +35,7 @@ from apps.security.models import Device, SecurityEvent
 from apps.analytics.models import UserActivity, SystemMetrics
 from apps.core.models import Product, User
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 
 def setup_database():
     """Setup database with your CSV data"""
@@ -29,41 +44,37 @@ def setup_database():
     
     User = get_user_model()
     
-    # Create admin user if not exists
-    admin_user, created = User.objects.get_or_create(
-        username='admin',
-        defaults={
-            'email': 'admin@finmark.local',
-            'is_staff': True,
-            'is_superuser': True,
-            'role': 'admin'
-        }
-    )
-    
-    if created:
-        admin_user.set_password('admin123')
-        admin_user.save()
-        print("✅ Created admin user: admin / admin123")
-    
-    # Create additional users for testing
+    # Create the demo users that don't exist yet: one SELECT, one INSERT
     users_data = [
+        {'username': 'admin', 'password': 'admin123', 'role': 'admin', 'email': 'admin@finmark.local', 'is_superuser': True},
         {'username': 'security', 'password': 'security123', 'role': 'security', 'email': 'security@finmark.com'},
         {'username': 'analyst', 'password': 'analyst123', 'role': 'analyst', 'email': 'analyst@finmark.com'}
     ]
     
-    for user_data in users_data:
-        user, created = User.objects.get_or_create(
+    existing = set(User.objects.filter(
+        username__in=[user_data['username'] for user_data in users_data]
+    ).values_list('username', flat=True))
+    new_users = [user_data for user_data in users_data if user_data['username'] not in existing]
+    
+    # PBKDF2 runs in C with the GIL released, so the password hashes run side by side
+    with ThreadPoolExecutor() as pool:
+        hashed_passwords = list(pool.map(make_password, [user_data['password'] for user_data in new_users]))
+    
+    User.objects.bulk_create([
+        User(
             username=user_data['username'],
-            defaults={
-                'email': user_data['email'],
-                'role': user_data['role'],
-                'is_staff': True
-            }
+            email=user_data['email'],
+            role=user_data['role'],
+            is_staff=True,
+            is_superuser=user_data.get('is_superuser', False),
+            password=password
         )
-        if created:
-            user.set_password(user_data['password'])
-            user.save()
-            print(f"✅ Created {user_data['role']} user: {user_data['username']} / {user_data['password']}")
+        for user_data, password in zip(new_users, hashed_passwords)
+    ])
+    for user_data in new_users:
+        print(f"✅ Created {user_data['role']} user: {user_data['username']} / {user_data['password']}")
+    
+    admin_user = User.objects.get(username='admin')
     
     # Clear existing data
     print("\n🧹 Clearing existing data...")
@@ -97,12 +108,12 @@ def load_network_inventory():
         df = pd.read_csv('network_inventory.csv')
         print(f"Found {len(df)} devices in network_inventory.csv")
         
-        for _, row in df.iterrows():
-            device_name = str(row.get('Device', 'Unknown')).strip()
-            ip_address = str(row.get('IP_Address', '127.0.0.1')).strip()
-            role = str(row.get('Role', 'unknown')).lower()
-            os_info = str(row.get('OS', 'Unknown')).strip()
-            notes = str(row.get('Notes', '')).strip()
+        for row in df.itertuples(index=False):
+            device_name = str(getattr(row, 'Device', 'Unknown')).strip()
+            ip_address = str(getattr(row, 'IP_Address', '127.0.0.1')).strip()
+            role = str(getattr(row, 'Role', 'unknown')).lower()
+            os_info = str(getattr(row, 'OS', 'Unknown')).strip()
+            notes = str(getattr(row, 'Notes', '')).strip()
             
             # Determine device type
             if 'router' in role:
@@ -172,11 +183,11 @@ def load_security_events():
             for i in range(0, min(len(df), 500), batch_size):  # Limit to 500 events
                 batch = df.iloc[i:i+batch_size]
                 
-                for _, row in batch.iterrows():
-                    event_type = str(row.get('event_type', 'unknown')).lower()
-                    user_id = str(row.get('user_id', ''))
-                    product_id = str(row.get('product_id', ''))
-                    amount = row.get('amount', 0)
+                for row in batch.itertuples(index=False):
+                    event_type = str(getattr(row, 'event_type', 'unknown')).lower()
+                    user_id = str(getattr(row, 'user_id', ''))
+                    product_id = str(getattr(row, 'product_id', ''))
+                    amount = getattr(row, 'amount', 0)
                     
                     # Convert old dates to recent dates for better dashboard experience
                     base_time = datetime.now()
@@ -208,13 +219,13 @@ def load_security_events():
                         source_ip = f"192.168.1.{random.randint(1, 254)}"
                     
                     # Create event details
-                    details = f"Event: {event_type}"
+                    details = {'event_type': event_type}
                     if user_id:
-                        details += f" | User: {user_id}"
+                        details['user'] = user_id
                     if product_id:
-                        details += f" | Product: {product_id}"
+                        details['product'] = product_id
                     if amount and amount > 0:
-                        details += f" | Amount: ${amount:.2f}"
+                        details['amount'] = round(float(amount), 2)
                     
                     SecurityEvent.objects.create(
                         event_type=sec_event_type,
@@ -240,7 +251,7 @@ def load_security_events():
             'event_type': 'login_failure',
             'severity': 'critical',
             'source_ip': '203.0.113.15',
-            'details': 'Multiple failed login attempts detected (50+ attempts)',
+            'details': {'message': 'Multiple failed login attempts detected (50+ attempts)'},
             'is_threat': True,
             'timestamp': datetime.now() - timedelta(minutes=15)
         },
@@ -248,7 +259,7 @@ def load_security_events():
             'event_type': 'malware_detected',
             'severity': 'critical',
             'source_ip': '10.0.0.102',
-            'details': 'Malware signature detected on PC-Client-02',
+            'details': {'message': 'Malware signature detected on PC-Client-02'},
             'is_threat': True,
             'timestamp': datetime.now() - timedelta(hours=2)
         },
@@ -256,7 +267,7 @@ def load_security_events():
             'event_type': 'ddos_attack',
             'severity': 'critical',
             'source_ip': '198.51.100.1',
-            'details': 'DDoS attack detected from external sources',
+            'details': {'message': 'DDoS attack detected from external sources'},
             'is_threat': True,
             'timestamp': datetime.now() - timedelta(hours=6)
         },
@@ -264,7 +275,7 @@ def load_security_events():
             'event_type': 'unauthorized_access',
             'severity': 'warning',
             'source_ip': '192.168.1.45',
-            'details': 'Unauthorized admin panel access attempt',
+            'details': {'message': 'Unauthorized admin panel access attempt'},
             'is_threat': True,
             'timestamp': datetime.now() - timedelta(minutes=45)
         }
@@ -315,29 +326,27 @@ def load_user_activities(admin_user):
         df = pd.read_csv('marketing_summary.csv')
         print(f"Found {len(df)} records in marketing_summary.csv")
         
-        activities_created = 0
         now = datetime.now()
+        rng = np.random.default_rng()
+        sample = df.head(50)  # Limit to 50 records
+        count = len(sample)
         
-        for i, row in df.head(50).iterrows():  # Limit to 50 records
-            # Convert to recent dates
-            days_ago = random.randint(0, 30)
-            hours_ago = random.randint(0, 23)
-            activity_time = now - timedelta(days=days_ago, hours=hours_ago)
-            
-            # Get data from CSV
-            users_active = row.get('users_active', 0)
-            total_sales = row.get('total_sales', 0)
-            new_customers = row.get('new_customers', 0)
-            
-            # Create activity based on data
-            event_types = ['page_view', 'login', 'logout', 'search', 'checkout']
-            event_type = random.choice(event_types)
-            
-            UserActivity.objects.create(
+        # CSV columns as plain Python lists so the JSON details hold no numpy scalars
+        def column(name):
+            return sample[name].tolist() if name in sample else [0] * count
+        
+        # Random dates/IPs/types for every row in one call each
+        days_ago = rng.integers(0, 31, size=count).tolist()
+        hours_ago = rng.integers(0, 24, size=count).tolist()
+        host_octets = rng.integers(1, 255, size=count).tolist()
+        event_types = rng.choice(['page_view', 'login', 'logout', 'search', 'checkout'], size=count).tolist()
+        
+        activities = [
+            UserActivity(
                 user=admin_user,
-                event_type=event_type,
-                timestamp=activity_time,
-                ip_address=f"192.168.1.{random.randint(1, 254)}",
+                event_type=event_types[i],
+                timestamp=now - timedelta(days=days_ago[i], hours=hours_ago[i]),
+                ip_address=f"192.168.1.{host_octets[i]}",
                 details={
                     'daily_users': users_active,
                     'sales': float(total_sales) if total_sales else 0,
@@ -345,26 +354,29 @@ def load_user_activities(admin_user):
                     'session_id': f"session_{i}"
                 }
             )
-            activities_created += 1
+            for i, (users_active, total_sales, new_customers) in enumerate(zip(
+                column('users_active'), column('total_sales'), column('new_customers')
+            ))
+        ]
+        UserActivity.objects.bulk_create(activities, batch_size=50)
         
-        print(f"✅ Created {activities_created} user activities")
+        print(f"✅ Created {len(activities)} user activities")
         
     except FileNotFoundError:
         print("⚠️ marketing_summary.csv not found, creating sample activities")
         
         # Create sample activities
-        for i in range(20):
-            days_ago = random.randint(0, 7)
-            hours_ago = random.randint(0, 23)
-            activity_time = datetime.now() - timedelta(days=days_ago, hours=hours_ago)
-            
-            UserActivity.objects.create(
+        now = datetime.now()
+        UserActivity.objects.bulk_create([
+            UserActivity(
                 user=admin_user,
                 event_type=random.choice(['page_view', 'login', 'search', 'checkout']),
-                timestamp=activity_time,
+                timestamp=now - timedelta(days=random.randint(0, 7), hours=random.randint(0, 23)),
                 ip_address=f"192.168.1.{random.randint(1, 254)}",
                 details={'session_id': f"session_{i}"}
             )
+            for i in range(20)
+        ])
         
         print("✅ Created 20 sample user activities")
 
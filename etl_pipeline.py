@@ -44,6 +44,10 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Device notes keywords that set the device status (checked per inventory row)
+CRITICAL_NOTE_KEYWORDS = ('no antivirus', 'outdated', 'no firewall', 'vulnerable')
+WARNING_NOTE_KEYWORDS = ('ssl', 'tls', 'update', 'patch')
+
 class FinMarkETLPipeline:
     """
     FinMark ETL Pipeline for processing security and business data
@@ -164,14 +168,14 @@ class FinMarkETLPipeline:
         
         cleaned_devices = []
         
-        for index, row in df.iterrows():
+        for index, row in enumerate(df.itertuples(index=False)):
             try:
                 # Data cleaning and validation
-                device_name = str(row.get('Device', '')).strip()
-                ip_address = str(row.get('IP_Address', '')).strip()
-                role = str(row.get('Role', '')).strip()
-                os_info = str(row.get('OS', '')).strip()
-                notes = str(row.get('Notes', '')).strip()
+                device_name = str(getattr(row, 'Device', '')).strip()
+                ip_address = str(getattr(row, 'IP_Address', '')).strip()
+                role = str(getattr(row, 'Role', '')).strip()
+                os_info = str(getattr(row, 'OS', '')).strip()
+                notes = str(getattr(row, 'Notes', '')).strip()
                 
                 # Validate IP address format
                 if not self._validate_ip_address(ip_address):
@@ -226,13 +230,13 @@ class FinMarkETLPipeline:
         sample_size = min(100, len(df))
         df_sample = df.head(sample_size)
         
-        for index, row in df_sample.iterrows():
+        for index, row in enumerate(df_sample.itertuples(index=False)):
             try:
-                event_type = str(row.get('event_type', 'unknown')).lower().strip()
-                user_id = str(row.get('user_id', 'unknown')).strip()
-                timestamp_str = str(row.get('event_time', ''))
-                product_id = str(row.get('product_id', ''))
-                amount = row.get('amount', 0)
+                event_type = str(getattr(row, 'event_type', 'unknown')).lower().strip()
+                user_id = str(getattr(row, 'user_id', 'unknown')).strip()
+                timestamp_str = str(getattr(row, 'event_time', ''))
+                product_id = str(getattr(row, 'product_id', ''))
+                amount = getattr(row, 'amount', 0)
                 
                 # Clean and categorize event type
                 security_event_type, severity, is_threat = self._categorize_security_event(event_type)
@@ -321,22 +325,21 @@ class FinMarkETLPipeline:
         
         loaded_count = 0
         
+        # One row per hostname (first wins); a single insert replaces per-row get_or_create,
+        # with hostnames already in the table skipped by the unique index
+        devices_by_hostname = {}
         for device_data in devices:
-            try:
-                device, created = Device.objects.get_or_create(
-                    hostname=device_data['hostname'],
-                    defaults=device_data
-                )
-                
-                if created:
-                    loaded_count += 1
-                    logger.debug(f"✅ Loaded device: {device.hostname}")
-                else:
-                    logger.debug(f"⚠️ Device already exists: {device.hostname}")
-                
-            except Exception as e:
-                logger.error(f"❌ Error loading device {device_data.get('hostname')}: {e}")
-                self.errors.append(f"Device loading error: {e}")
+            devices_by_hostname.setdefault(device_data['hostname'], Device(**device_data))
+        
+        try:
+            existing = Device.objects.count()
+            Device.objects.bulk_create(devices_by_hostname.values(), batch_size=500, ignore_conflicts=True)
+            # ignore_conflicts leaves skipped rows indistinguishable, so count what was added
+            loaded_count = Device.objects.count() - existing
+            
+        except Exception as e:
+            logger.error(f"❌ Error loading devices: {e}")
+            self.errors.append(f"Device loading error: {e}")
         
         logger.info(f"✅ Devices loading complete: {loaded_count} new records")
         return loaded_count
@@ -422,12 +425,9 @@ class FinMarkETLPipeline:
         """Determine device status from notes"""
         notes_lower = notes.lower()
         
-        critical_keywords = ['no antivirus', 'outdated', 'no firewall', 'vulnerable']
-        warning_keywords = ['ssl', 'tls', 'update', 'patch']
-        
-        if any(keyword in notes_lower for keyword in critical_keywords):
+        if any(keyword in notes_lower for keyword in CRITICAL_NOTE_KEYWORDS):
             return 'critical'
-        elif any(keyword in notes_lower for keyword in warning_keywords):
+        elif any(keyword in notes_lower for keyword in WARNING_NOTE_KEYWORDS):
             return 'warning'
         else:
             return 'active'
@@ -456,24 +456,24 @@ class FinMarkETLPipeline:
             # Internal activities from local network
             return f"192.168.1.{np.random.randint(1, 254)}"
     
-    def _create_event_details(self, event_type: str, user_id: str, product_id: str, amount: float) -> str:
-        """Create detailed event description"""
-        details = f"Event Type: {event_type}"
+    def _create_event_details(self, event_type: str, user_id: str, product_id: str, amount: float) -> Dict:
+        """Create detailed event description for the JSON details column"""
+        details = {'event_type': event_type}
         
         if user_id != 'unknown':
-            details += f" | User: {user_id}"
+            details['user'] = user_id
         
         if product_id:
-            details += f" | Product: {product_id}"
+            details['product'] = product_id
         
         if amount and amount > 0:
-            details += f" | Amount: ${amount:.2f}"
+            details['amount'] = round(float(amount), 2)
         
         # Add security context
         if 'login' in event_type.lower():
-            details += " | SECURITY: Multiple failed authentication attempts"
+            details['context'] = 'SECURITY: Multiple failed authentication attempts'
         elif 'checkout' in event_type.lower():
-            details += " | BUSINESS: Transaction completed"
+            details['context'] = 'BUSINESS: Transaction completed'
         
         return details
     
@@ -304,22 +304,30 @@ print_info "Running database fix..."
 python << 'EOF'
 import os
 import sys
+import importlib.util
 
 # Setup Django
 def setup_django():
     settings_modules = ['backend.settings', 'finmark_project.settings', 'finmark.settings']
     
     for module in settings_modules:
+        # find_spec raises when the parent package is missing, returns None when settings is
         try:
-            module_path = module.replace('.', os.sep) + '.py'
-            if os.path.exists(module_path):
-                os.environ.setdefault('DJANGO_SETTINGS_MODULE', module)
-                import django
-                django.setup()
-                print(f"✅ Using {module}")
-                return True
-        except:
+            found = importlib.util.find_spec(module) is not None
+        except ImportError:
+            found = False
+        if not found:
             continue
+        
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', module)
+        import django
+        try:
+            django.setup()
+        except Exception as e:
+            print(f"❌ Django setup failed with {module}: {e}")
+            return False
+        print(f"✅ Using {module}")
+        return True
     
     return False
 